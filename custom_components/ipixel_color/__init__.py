@@ -10,6 +10,7 @@ from homeassistant.exceptions import ConfigEntryNotReady
 
 from .api import iPIXELAPI, iPIXELConnectionError, iPIXELTimeoutError
 from .const import DOMAIN, CONF_ADDRESS, CONF_NAME
+from .fonts import get_custom_font_names
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -34,11 +35,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         if not await api.connect():
             raise ConfigEntryNotReady(f"Failed to connect to iPIXEL device at {address}")
         
+        # Device info for sensors is fetched during connect
         _LOGGER.info("Successfully connected to iPIXEL device %s", address)
         
-        # Get device info for sensors
-        await api.get_device_info()
-        
     except iPIXELTimeoutError as err:
         _LOGGER.error("Connection timeout to iPIXEL device %s: %s", address, err)
         raise ConfigEntryNotReady(f"Connection timeout: {err}") from err
@@ -52,6 +51,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.data[DOMAIN][entry.entry_id] = api
     entry.runtime_data = api
     
+    # List the bundled fonts off the event loop, display updates read the cache
+    await hass.async_add_executor_job(get_custom_font_names)
+
     # Set up platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from functools import partial
 from typing import Any, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -26,6 +27,20 @@ _LOGGER = logging.getLogger(__name__)
 class iPIXELAPI:
     """iPIXEL Color device API client - simplified facade."""
 
+    __slots__ = (
+        "_hass",
+        "_address",
+        "_bluetooth",
+        "_connect_lock",
+        "_power_state",
+        "_device_info",
+        "_device_info_is_fallback",
+        "_device_response",
+        "_last_image_key",
+        "_last_image_size",
+        "_last_image_commands",
+    )
+
     def __init__(self, hass: HomeAssistant, address: str) -> None:
         """Initialize the API client.
 
@@ -33,15 +48,37 @@ class iPIXELAPI:
             hass: Home Assistant instance
             address: Bluetooth MAC address
         """
+        self._hass = hass
         self._address = address
         self._bluetooth = BluetoothClient(hass, address)
+        self._connect_lock = asyncio.Lock()
         self._power_state = False
         self._device_info: dict[str, Any] | None = None
+        # True while _device_info holds the defaults from a failed query
+        self._device_info_is_fallback = False
         self._device_response: bytes | None = None
+        # Last rendered text image, reused when the same text is shown again
+        self._last_image_key: tuple | None = None
+        self._last_image_size = 0
+        self._last_image_commands: list[bytes] = []
         
     async def connect(self) -> bool:
-        """Connect to the iPIXEL device."""
-        return await self._bluetooth.connect(self._notification_handler)
+        """Connect to the iPIXEL device and preload its device info.
+
+        Concurrent callers are serialized so simultaneous updates do not start
+        several BLE connections; callers that waited reuse the new connection.
+        """
+        async with self._connect_lock:
+            if self._bluetooth.is_connected:
+                return True
+
+            connected = await self._bluetooth.connect(self._notification_handler)
+            if connected and (self._device_info is None or self._device_info_is_fallback):
+                # Real device info is kept across reconnects, only a failed
+                # query (cached as the fallback dimensions) is retried
+                self.invalidate_device_info()
+                await self.get_device_info()
+            return connected
     
     async def disconnect(self) -> None:
         """Disconnect from the device."""
@@ -150,6 +187,17 @@ class iPIXELAPI:
             _LOGGER.error("Error setting clock mode: %s", err)
             return False
     
+    def invalidate_device_info(self) -> None:
+        """Drop cached device info so it is queried again on next connect.
+
+        The cached image frames were built for the old device type and LED
+        type, so they are dropped as well.
+        """
+        self._device_info = None
+        self._device_info_is_fallback = False
+        self._last_image_key = None
+        self._last_image_commands = []
+
     async def get_device_info(self) -> dict[str, Any] | None:
         """Query device information and store it."""
         if self._device_info is not None:
@@ -158,27 +206,25 @@ class iPIXELAPI:
         try:
             command = build_device_info_command()
             
-            # Set up notification response
+            # Set up notification response, created before the write so an
+            # early reply cannot be missed
             self._device_response = None
-            response_received = asyncio.Event()
+            response: asyncio.Future[bytes] = asyncio.get_running_loop().create_future()
             
             def response_handler(sender: Any, data: bytearray) -> None:
-                self._device_response = bytes(data)
-                response_received.set()
+                if not response.done():
+                    response.set_result(bytes(data))
             
-            # Enable notifications temporarily
-            await self._bluetooth._client.start_notify(
-                "0000fa03-0000-1000-8000-00805f9b34fb", response_handler
-            )
+            # Route the reply from the persistent notification subscription
+            self._bluetooth.set_response_handler(response_handler)
             
             try:
                 # Send command
-                await self._bluetooth._client.write_gatt_char(
-                    "0000fa02-0000-1000-8000-00805f9b34fb", command
-                )
+                await self._bluetooth.write(command)
                 
                 # Wait for response (5 second timeout)
-                await asyncio.wait_for(response_received.wait(), timeout=5.0)
+                async with asyncio.timeout(5.0):
+                    self._device_response = await response
                 
                 if self._device_response:
                     self._device_info = parse_device_response(self._device_response)
@@ -186,16 +232,15 @@ class iPIXELAPI:
                     raise Exception("No response received")
                     
             finally:
-                await self._bluetooth._client.stop_notify(
-                    "0000fa03-0000-1000-8000-00805f9b34fb"
-                )
+                self._bluetooth.set_response_handler(None)
             
             _LOGGER.info("Device info retrieved: %s", self._device_info)
             return self._device_info
             
         except Exception as err:
             _LOGGER.error("Failed to get device info: %s", err)
-            # Return default values
+            # Return default values, retried on the next connection
+            self._device_info_is_fallback = True
             self._device_info = {
                 "width": 64,
                 "height": 16,
@@ -222,21 +267,39 @@ class iPIXELAPI:
             bg_color: Background color in hex format (e.g., '000000')
         """
         try:
-            # Get device dimensions
-            device_info = await self.get_device_info()
+            # Get device dimensions (cached at connect time)
+            device_info = self._device_info or await self.get_device_info()
             width = device_info["width"]
             height = device_info["height"]
 
-            # Render text to PNG with color gradient
-            png_data = render_text_to_png(text, width, height, antialias, font_size, font, line_spacing, text_color, bg_color)
-
-            # Generate image commands using pypixelcolor
-            commands = make_image_command(
-                image_bytes=png_data,
-                file_extension=".png",
-                resize_method="crop",
-                device_info_dict=device_info
-            )
+            # Identical input renders to identical frames, reuse the last ones
+            image_key = (text, antialias, font_size, font, line_spacing,
+                         text_color, bg_color, width, height)
+            if image_key == self._last_image_key and self._last_image_commands:
+                commands = self._last_image_commands
+                png_size = self._last_image_size
+                _LOGGER.debug("Reusing cached image frames for unchanged text")
+            else:
+                # Render text to PNG with color gradient (CPU-bound, keep it off the event loop)
+                png_data = await self._hass.async_add_executor_job(
+                    render_text_to_png, text, width, height, antialias,
+                    font_size, font, line_spacing, text_color, bg_color
+                )
+                png_size = len(png_data)
+
+                # Generate image commands using pypixelcolor (decodes and packs the image)
+                commands = await self._hass.async_add_executor_job(
+                    partial(
+                        make_image_command,
+                        image_bytes=png_data,
+                        file_extension=".png",
+                        resize_method="crop",
+                        device_info_dict=device_info
+                    )
+                )
+                self._last_image_key = image_key
+                self._last_image_size = png_size
+                self._last_image_commands = commands
 
             # Send all command frames
             for i, command in enumerate(commands):
@@ -256,7 +319,7 @@ class iPIXELAPI:
                 text,
                 width,
                 height,
-                len(png_data),
+                png_size,
                 len(commands)
             )
             return True
@@ -290,21 +353,24 @@ class iPIXELAPI:
             True if text was sent successfully
         """
         try:
-            # Get device info for height
-            device_info = await self.get_device_info()
+            # Get device info for height (cached at connect time)
+            device_info = self._device_info or await self.get_device_info()
             device_height = device_info["height"]
 
-            # Generate text commands using pypixelcolor
-            commands = make_text_command(
-                text=text,
-                color=color,
-                bg_color=bg_color,
-                font=font,
-                animation=animation,
-                speed=speed,
-                rainbow_mode=rainbow_mode,
-                save_slot=0,
-                device_height=device_height
+            # Generate text commands using pypixelcolor (rasterizes glyphs)
+            commands = await self._hass.async_add_executor_job(
+                partial(
+                    make_text_command,
+                    text=text,
+                    color=color,
+                    bg_color=bg_color,
+                    font=font,
+                    animation=animation,
+                    speed=speed,
+                    rainbow_mode=rainbow_mode,
+                    save_slot=0,
+                    device_height=device_height
+                )
             )
 
             # Send all command frames
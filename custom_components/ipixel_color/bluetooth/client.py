@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
 from typing import Any, Callable, TYPE_CHECKING
 
@@ -12,11 +13,12 @@ from bleak_retry_connector import (
 )
 
 if TYPE_CHECKING:
+    from bleak.backends.characteristic import BleakGATTCharacteristic
     from homeassistant.core import HomeAssistant
 
 from homeassistant.components import bluetooth
 
-from ..const import WRITE_UUID, NOTIFY_UUID
+from ..const import WRITE_UUID, NOTIFY_UUID, DISCONNECT_TIMEOUT
 from ..exceptions import iPIXELConnectionError
 
 _LOGGER = logging.getLogger(__name__)
@@ -25,6 +27,17 @@ _LOGGER = logging.getLogger(__name__)
 class BluetoothClient:
     """Manages Bluetooth connection and communication."""
 
+    __slots__ = (
+        "_hass",
+        "_address",
+        "_client",
+        "_connected",
+        "_notification_handler",
+        "_response_handler",
+        "_write_char",
+        "_notify_char",
+    )
+
     def __init__(self, hass: HomeAssistant, address: str) -> None:
         """Initialize Bluetooth client.
 
@@ -37,6 +50,10 @@ class BluetoothClient:
         self._client: BleakClientWithServiceCache | None = None
         self._connected = False
         self._notification_handler: Callable | None = None
+        self._response_handler: Callable[[Any, bytearray], None] | None = None
+        # Resolved GATT characteristics, UUIDs until connected
+        self._write_char: BleakGATTCharacteristic | str = WRITE_UUID
+        self._notify_char: BleakGATTCharacteristic | str = NOTIFY_UUID
 
     def _disconnected_callback(self, client: BleakClientWithServiceCache) -> None:
         """Called when device disconnects."""
@@ -82,9 +99,16 @@ class BluetoothClient:
 
             self._connected = True
 
-            # Store and enable notifications
+            # Resolve characteristics once so writes skip the per-call UUID lookup
+            services = self._client.services
+            write_char = services.get_characteristic(WRITE_UUID)
+            notify_char = services.get_characteristic(NOTIFY_UUID)
+            self._write_char = write_char or WRITE_UUID
+            self._notify_char = notify_char or NOTIFY_UUID
+
+            # Store and enable notifications once, responses are routed by _on_notify
             self._notification_handler = notification_handler
-            await self._client.start_notify(NOTIFY_UUID, notification_handler)
+            await self._client.start_notify(self._notify_char, self._on_notify)
             _LOGGER.info("Successfully connected to iPIXEL device")
             return True
 
@@ -95,18 +119,56 @@ class BluetoothClient:
             _LOGGER.error("Unexpected error connecting to %s: %s", self._address, err)
             raise iPIXELConnectionError(f"Connection failed: {err}") from err
 
+    def _on_notify(self, sender: Any, data: bytearray) -> None:
+        """Route a notification to the pending response handler or the general one."""
+        handler = self._response_handler or self._notification_handler
+        if handler:
+            handler(sender, data)
+
+    def set_response_handler(
+        self, handler: Callable[[Any, bytearray], None] | None
+    ) -> None:
+        """Set (or clear with None) the handler receiving the next responses.
+
+        While set, notifications go to this handler instead of the general
+        notification handler, so the subscription never has to be restarted.
+        """
+        self._response_handler = handler
+
     async def disconnect(self) -> None:
         """Disconnect from the device."""
         if self._client and self._connected:
             try:
-                await self._client.stop_notify(NOTIFY_UUID)
-                await self._client.disconnect()
+                # A device that already dropped off can leave either call
+                # hanging, the link is closed even if stop_notify fails
+                with contextlib.suppress(TimeoutError, BleakError):
+                    async with asyncio.timeout(DISCONNECT_TIMEOUT):
+                        await self._client.stop_notify(self._notify_char)
+                async with asyncio.timeout(DISCONNECT_TIMEOUT):
+                    await self._client.disconnect()
                 _LOGGER.debug("Disconnected from iPIXEL device")
+            except TimeoutError:
+                _LOGGER.warning("Disconnect timed out after %ss", DISCONNECT_TIMEOUT)
             except BleakError as err:
                 _LOGGER.error("Error during disconnect: %s", err)
             finally:
                 self._connected = False
                 self._client = None  # Don't reuse client - create fresh for next connection
+                self._write_char = WRITE_UUID
+                self._notify_char = NOTIFY_UUID
+
+    async def write(self, command: bytes) -> None:
+        """Write command in a single GATT write without awaiting a notification.
+
+        Args:
+            command: Command bytes to send
+
+        Raises:
+            iPIXELConnectionError: If not connected
+        """
+        if not self._connected or not self._client:
+            raise iPIXELConnectionError("Device not connected")
+        await self._client.write_gatt_char(self._write_char, command)
 
     async def send_command(self, command: bytes) -> bool:
         """Send command to the device and log any response.
@@ -133,19 +195,14 @@ class BluetoothClient:
                 response_received.set()
                 _LOGGER.info("Device response: %s", data.hex())
 
-            # Stop existing notifications first to avoid "already enabled" error
-            try:
-                await self._client.stop_notify(NOTIFY_UUID)
-            except (KeyError, BleakError) as e:
-                # No callback was registered yet, which is fine
-                _LOGGER.debug("Could not stop notifications (not started): %s", e)
-
-            # Enable notifications to capture response
-            await self._client.start_notify(NOTIFY_UUID, response_handler)
+            # Capture responses through the persistent subscription
+            self.set_response_handler(response_handler)
 
             try:
-                _LOGGER.debug("Sending command: %s", command.hex())
-                await self._client.write_gatt_char(WRITE_UUID, command)
+                # Image frames are kilobytes long, only hex them when debugging
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug("Sending command: %s", command.hex())
+                await self._client.write_gatt_char(self._write_char, command)
 
                 # Wait for response with short timeout
                 try:
@@ -158,17 +215,7 @@ class BluetoothClient:
                     _LOGGER.debug("No response received within 2 seconds")
 
             finally:
-                # Restore the original notification handler
-                try:
-                    await self._client.stop_notify(NOTIFY_UUID)
-                except (KeyError, BleakError) as e:
-                    _LOGGER.debug("Could not stop notifications in cleanup: %s", e)
-
-                if self._notification_handler:
-                    try:
-                        await self._client.start_notify(NOTIFY_UUID, self._notification_handler)
-                    except BleakError as e:
-                        _LOGGER.warning("Could not restart original notification handler: %s", e)
+                self.set_response_handler(None)
 
             return True
         except BleakError as err:
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+import traceback
 from typing import Any, TYPE_CHECKING
 
 from homeassistant.components import bluetooth
@@ -61,6 +62,5 @@ def discover_ipixel_devices_ha(hass: HomeAssistant, return_all: bool = False) ->
 
     except Exception as err:
         _LOGGER.error("Discovery failed: %s", err)
-        import traceback
         _LOGGER.error("Traceback: %s", traceback.format_exc())
         return []
\ No newline at end of file
@@ -8,11 +8,10 @@ from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.entity import DeviceInfo
 
 from .api import iPIXELAPI
 from .const import DOMAIN, CONF_ADDRESS, CONF_NAME
-from .common import update_ipixel_display
+from .common import build_device_info, update_ipixel_display
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -55,16 +54,9 @@ class iPIXELUpdateButton(ButtonEntity):
         self._name = name
         self._attr_name = "Update Display"
         self._attr_unique_id = f"{address}_update_button"
-        self._attr_entity_description = "Manually update display with current text and settings"
         
         # Device info for grouping in device registry
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, address)},
-            name=name,
-            manufacturer="iPIXEL",
-            model="LED Matrix Display",
-            sw_version="1.0",
-        )
+        self._attr_device_info = build_device_info(address, name)
 
     async def async_press(self) -> None:
         """Handle button press to update display."""
@@ -98,16 +90,9 @@ class iPIXELSyncTimeButton(ButtonEntity):
         self._name = name
         self._attr_name = "Sync Time"
         self._attr_unique_id = f"{address}_sync_time_button"
-        self._attr_entity_description = "Sync current time to device clock"
 
         # Device info for grouping in device registry
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, address)},
-            name=name,
-            manufacturer="iPIXEL",
-            model="LED Matrix Display",
-            sw_version="1.0",
-        )
+        self._attr_device_info = build_device_info(address, name)
 
     async def async_press(self) -> None:
         """Handle button press to sync time."""
@@ -2,24 +2,37 @@
 from __future__ import annotations
 
 import logging
+import re
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from homeassistant.components.text import TextEntity, TextMode
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.restore_state import RestoreEntity
 
 if TYPE_CHECKING:
     from .api import iPIXELAPI
 
-from .const import DOMAIN
-from .common import get_entity_id_by_unique_id, rgb_to_hex
+from .common import build_device_info, get_entity_id_by_unique_id, is_entity_on, rgb_to_hex, update_ipixel_display
 
 _LOGGER = logging.getLogger(__name__)
 
+_HEX_COLOR_RE = re.compile(r"^[0-9A-Fa-f]{6}$")
+
 
 # Utility functions for color conversion
+@lru_cache(maxsize=32)
+def _parse_rgb(hex_color: str) -> tuple[int, int, int] | None:
+    """Parse 6 hex digits into an RGB tuple, or None if they are not valid hex."""
+    try:
+        rgb = tuple(bytes.fromhex(hex_color))
+    except ValueError:
+        return None
+    # fromhex skips whitespace, so a 6 character string may hold fewer bytes
+    return rgb if len(rgb) == 3 else None
+
+
 def hex_to_rgb(hex_color: str) -> tuple[int, int, int]:
     """Convert hex color string to RGB tuple.
 
@@ -38,13 +51,10 @@ def hex_to_rgb(hex_color: str) -> tuple[int, int, int]:
     if len(hex_color) != 6:
         raise ValueError(f"Invalid hex color length: {hex_color} (expected 6 characters)")
 
-    try:
-        r = int(hex_color[0:2], 16)
-        g = int(hex_color[2:4], 16)
-        b = int(hex_color[4:6], 16)
-        return (r, g, b)
-    except ValueError as e:
-        raise ValueError(f"Invalid hex color format: {hex_color}") from e
+    rgb = _parse_rgb(hex_color)
+    if rgb is None:
+        raise ValueError(f"Invalid hex color format: {hex_color}")
+    return rgb
 
 
 def hex_to_rgb_normalized(hex_color: str) -> tuple[float, float, float]:
@@ -88,17 +98,12 @@ class iPIXELColorBase(TextEntity, RestoreEntity):
         self._address = address
         self._name = name
         self._attr_name = self._color_name
+        self._log_name = self._color_name.lower()  # Lowercase label for log messages
         self._attr_unique_id = f"{address}_{self._entity_suffix}"
         self._current_value = self._default_color
 
         # Device info for grouping in device registry
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, address)},
-            name=name,
-            manufacturer="iPIXEL",
-            model="LED Matrix Display",
-            sw_version="1.0",
-        )
+        self._attr_device_info = build_device_info(address, name)
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -108,7 +113,7 @@ class iPIXELColorBase(TextEntity, RestoreEntity):
         last_state = await self.async_get_last_state()
         if last_state is not None and last_state.state:
             self._current_value = last_state.state
-            _LOGGER.debug("Restored %s: %s", self._color_name.lower(), self._current_value)
+            _LOGGER.debug("Restored %s: %s", self._log_name, self._current_value)
 
     @property
     def native_value(self) -> str | None:
@@ -151,8 +156,7 @@ class iPIXELColorBase(TextEntity, RestoreEntity):
     async def async_set_value(self, value: str) -> None:
         """Set the color value."""
         # Validate hex color format
-        import re
-        if not re.match(r"^[0-9A-Fa-f]{6}$", value):
+        if not _HEX_COLOR_RE.match(value):
             _LOGGER.error("Invalid hex color format: %s (expected 6 hex digits)", value)
             return
 
@@ -167,20 +171,16 @@ class iPIXELColorBase(TextEntity, RestoreEntity):
         if not self._trigger_modes:
             return
 
-        try:
-            from .common import update_ipixel_display
-
-            # Check if we're in one of the trigger modes
-            mode_entity_id = get_entity_id_by_unique_id(self.hass, self._address, "mode_select", "select")
-            mode_state = self.hass.states.get(mode_entity_id) if mode_entity_id else None
-
-            if mode_state and mode_state.state in self._trigger_modes:
-                # Check auto-update setting
-                auto_update_entity_id = get_entity_id_by_unique_id(self.hass, self._address, "auto_update", "switch")
-                auto_update_state = self.hass.states.get(auto_update_entity_id) if auto_update_entity_id else None
-
-                if auto_update_state and auto_update_state.state == "on":
-                    await update_ipixel_display(self.hass, self._name, self._api)
-                    _LOGGER.debug("Auto-update triggered due to %s change", self._color_name.lower())
-        except Exception as err:
-            _LOGGER.debug("Could not trigger auto-update: %s", err)
+        # Check if we're in one of the trigger modes
+        mode_entity_id = get_entity_id_by_unique_id(self.hass, self._address, "mode_select", "select")
+        mode_state = self.hass.states.get(mode_entity_id) if mode_entity_id else None
+        if mode_state is None or mode_state.state not in self._trigger_modes:
+            return
+
+        # Check auto-update setting
+        auto_update_entity_id = get_entity_id_by_unique_id(self.hass, self._address, "auto_update", "switch")
+        if not is_entity_on(self.hass, auto_update_entity_id):
+            return
+
+        await update_ipixel_display(self.hass, self._name, self._api)
+        _LOGGER.debug("Auto-update triggered due to %s change", self._log_name)
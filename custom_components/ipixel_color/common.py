@@ -2,13 +2,50 @@
 from __future__ import annotations
 
 import logging
+import re
+from functools import lru_cache
+
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.template import Template
 from homeassistant.helpers import entity_registry as er
 from .const import MODE_TEXT_IMAGE, MODE_TEXT, MODE_CLOCK, DOMAIN
+from .fonts import CUSTOM_FONTS_DIR, get_custom_font_names
 
 _LOGGER = logging.getLogger(__name__)
 
+# Fallback values for display settings whose entities are missing or unavailable
+_SETTING_DEFAULTS = {
+    "font": "OpenSans-Light.ttf",
+    "font_size": None,
+    "line_spacing": 0,
+    "antialiasing": True
+}
+
+# Literal escape sequences typed into the text entity, expanded in one pass
+_ESCAPE_MAP = {"\\n": "\n", "\\t": "\t"}
+_ESCAPE_RE = re.compile("|".join(re.escape(k) for k in _ESCAPE_MAP))
+
+
+@lru_cache(maxsize=None)
+def build_device_info(address: str, name: str) -> DeviceInfo:
+    """Build the device registry info shared by all entities of a device.
+
+    Args:
+        address: Device address
+        name: Device name
+
+    Returns:
+        DeviceInfo instance, the same object for every entity of the device
+    """
+    return DeviceInfo(
+        identifiers={(DOMAIN, address)},
+        name=name,
+        manufacturer="iPIXEL",
+        model="LED Matrix Display",
+        sw_version="1.0",
+    )
+
 
 def rgb_to_hex(r: int, g: int, b: int) -> str:
     """Convert RGB tuple to hex color string."""
@@ -62,17 +99,56 @@ def get_entity_id_by_unique_id(hass: HomeAssistant, address: str, entity_suffix:
     registry = er.async_get(hass)
     unique_id = f"{address}_{entity_suffix}"
 
-    # Look up entity by unique_id
+    # With a platform the registry's (domain, platform, unique_id) index
+    # answers directly, no need to walk every registered entity
+    if platform:
+        return registry.async_get_entity_id(platform, DOMAIN, unique_id)
+
+    # Without a platform, look up entity by unique_id across all domains
     for entity_id, entry in registry.entities.items():
         if entry.unique_id == unique_id and entry.platform == DOMAIN:
-            # If platform specified, verify it matches
-            if platform and not entity_id.startswith(f"{platform}."):
-                continue
             return entity_id
 
     return None
 
 
+def is_entity_on(hass: HomeAssistant, entity_id: str | None) -> bool:
+    """Return True if the entity exists and its state is 'on'.
+
+    Args:
+        hass: Home Assistant instance
+        entity_id: Entity ID to check, or None if it could not be resolved
+
+    Returns:
+        True if the entity state is 'on'
+    """
+    if not entity_id:
+        return False
+    state = hass.states.get(entity_id)
+    return state is not None and state.state == "on"
+
+
+def state_to_int(state: str) -> int:
+    """Convert an entity state string to an int.
+
+    Integer states are parsed directly, the float parse only runs for
+    states like '3.0'.
+
+    Args:
+        state: Entity state string
+
+    Returns:
+        Integer value of the state
+
+    Raises:
+        ValueError: If the state is not numeric
+    """
+    try:
+        return int(state)
+    except ValueError:
+        return int(float(state))
+
+
 async def resolve_template_variables(hass: HomeAssistant, text: str) -> str:
     """Resolve Home Assistant template variables in text.
     
@@ -100,9 +176,24 @@ async def resolve_template_variables(hass: HomeAssistant, text: str) -> str:
         return text
 
 
+def process_escape_sequences(text: str) -> str:
+    """Expand literal \\n and \\t sequences into newlines and tabs.
+
+    Args:
+        text: Text possibly containing literal escape sequences
+
+    Returns:
+        Text with escape sequences expanded
+    """
+    return _ESCAPE_RE.sub(lambda m: _ESCAPE_MAP[m.group(0)], text)
+
+
 async def update_ipixel_display(hass: HomeAssistant, device_name: str, api, text: str = None) -> bool:
     """Update iPIXEL display with current settings - can be called from anywhere.
-    
+
+    Errors are caught and logged here and reported through the return value,
+    so callers can await it without their own try/except.
+
     Args:
         hass: Home Assistant instance
         device_name: Device name for entity ID lookups
@@ -178,17 +269,18 @@ async def _update_textimage_mode(hass: HomeAssistant, device_name: str, api, tex
 
         # Resolve templates and process escape sequences
         template_resolved = await resolve_template_variables(hass, text)
-        processed_text = template_resolved.replace('\\n', '\n').replace('\\t', '\t')
+        processed_text = process_escape_sequences(template_resolved)
 
         # Send text to display with current settings
         success = await api.display_text(processed_text, antialias, font_size, font_name, line_spacing, text_color, bg_color)
         
-        if success:
+        if not success:
+            _LOGGER.error("Display update failed")
+        elif _LOGGER.isEnabledFor(logging.INFO):
+            # Only build the size display string when it will be logged
             _LOGGER.info("Display update successful: %s (font: %s, size: %s, antialias: %s, spacing: %spx, text: #%s, bg: #%s)",
                        processed_text, font_name or "OpenSans-Light.ttf",
                        f"{font_size:.1f}px" if font_size else "Auto", antialias, line_spacing, text_color, bg_color)
-        else:
-            _LOGGER.error("Display update failed")
             
         return success
         
@@ -276,16 +368,14 @@ async def _update_text_mode(hass: HomeAssistant, device_name: str, api, text: st
         font_name = await _get_entity_setting(hass, device_name, "select", "font_select", str, api._address)
         if font_name and font_name.endswith(('.ttf', '.otf')):
             # Custom TTF/OTF font from fonts/ folder
-            from pathlib import Path
-            font_path = Path(__file__).parent / "fonts" / font_name
-            font = str(font_path) if font_path.exists() else "CUSONG"
+            font = str(CUSTOM_FONTS_DIR / font_name) if font_name in get_custom_font_names() else "CUSONG"
         else:
             # Use pypixelcolor's built-in fonts or default
             font = "CUSONG"
 
         # Get background color from light entity
         bg_color = get_color_from_light_entity(hass, api._address, "background_color", default=None)
-        _LOGGER.debug("Text mode - background color: %s", f"#{bg_color}" if bg_color else "none")
+        _LOGGER.debug("Text mode - background color: %s", bg_color or "none")
 
         # Get text color from light entity
         color = get_color_from_light_entity(hass, api._address, "text_color", default="ffffff")
@@ -294,7 +384,8 @@ async def _update_text_mode(hass: HomeAssistant, device_name: str, api, text: st
             # We weight the channels since not each color appears as bright as the others.
             # In this way we choose the channel which should be less obvious.
             bg = bg_color or "000000"
-            r, g, b = int(bg[0:2], 16)*333, int(bg[2:4], 16)*169, int(bg[4:6], 16)*909 
+            r, g, b = bytes.fromhex(bg)
+            r, g, b = r*333, g*169, b*909
             if g >= r and g >= b:
                 color = "000100"
             elif b >= r:
@@ -325,7 +416,7 @@ async def _update_text_mode(hass: HomeAssistant, device_name: str, api, text: st
 
         # Resolve templates and process escape sequences
         template_resolved = await resolve_template_variables(hass, text)
-        processed_text = template_resolved.replace('\\n', '\n').replace('\\t', '\t')
+        processed_text = process_escape_sequences(template_resolved)
 
         # Send text using pypixelcolor
         success = await api.display_text_pypixelcolor(
@@ -373,7 +464,7 @@ async def _get_entity_setting(hass: HomeAssistant, device_name: str, platform: s
 
         # Fallback to manual construction if not found
         if not entity_id:
-            entity_id = f"{platform}.{device_name.lower().replace(' ', '_')}_{setting}"
+            entity_id = f"{platform}.{_device_slug(device_name)}_{setting}"
 
         state = hass.states.get(entity_id)
         
@@ -387,7 +478,7 @@ async def _get_entity_setting(hass: HomeAssistant, device_name: str, platform: s
             # Return None for 0 font size (auto-sizing)
             return None if setting == "font_size" and value == 0 else value
         elif value_type == int:
-            return int(float(state.state))
+            return state_to_int(state.state)
         else:
             # String value - return the font filename directly
             return state.state
@@ -397,15 +488,15 @@ async def _get_entity_setting(hass: HomeAssistant, device_name: str, platform: s
         return _get_default_value(setting, value_type)
 
 
+@lru_cache(maxsize=16)
+def _device_slug(device_name: str) -> str:
+    """Get the entity id slug for a device name (e.g. 'LED 1' -> 'led_1')."""
+    return device_name.lower().replace(' ', '_')
+
+
 def _get_default_value(setting: str, value_type):
     """Get default value for a setting."""
-    defaults = {
-        "font": "OpenSans-Light.ttf",
-        "font_size": None,
-        "line_spacing": 0,
-        "antialiasing": True
-    }
-    default = defaults.get(setting)
+    default = _SETTING_DEFAULTS.get(setting)
     
     if value_type == bool and default is None:
         return True
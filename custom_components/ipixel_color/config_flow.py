@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+import traceback
 from typing import Any
 import voluptuous as vol
 
@@ -89,7 +90,6 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             _LOGGER.debug("CONFIG_FLOW: Stored %d devices in _discovered_devices", len(self._discovered_devices))
         except Exception as err:
             _LOGGER.error("CONFIG_FLOW: Discovery failed: %s", err)
-            import traceback
             _LOGGER.error("CONFIG_FLOW: Traceback: %s", traceback.format_exc())
             errors["base"] = "discovery_failed"
 
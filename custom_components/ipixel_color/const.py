@@ -20,6 +20,7 @@ SCAN_INTERVAL = 30
 
 # Connection settings
 CONNECTION_TIMEOUT = 10
+DISCONNECT_TIMEOUT = 3  # seconds before giving up on a hung disconnect
 RECONNECT_ATTEMPTS = 3
 RECONNECT_DELAY = 1  # seconds between retry attempts
 
@@ -34,4 +35,11 @@ AVAILABLE_MODES = [
     MODE_CLOCK,
 ]
 
-DEFAULT_MODE = MODE_TEXT_IMAGE
\ No newline at end of file
+DEFAULT_MODE = MODE_TEXT_IMAGE
+
+# Clock styles supported by the device (0-8)
+CLOCK_STYLES = ["0", "1", "2", "3", "4", "5", "6", "7", "8"]
+DEFAULT_CLOCK_STYLE = "1"
+
+# Font bundled with the integration, used when no other font is selected
+DEFAULT_FONT = "OpenSans-Light.ttf"
\ No newline at end of file
@@ -1,6 +1,8 @@
 """Command building for iPIXEL Color devices."""
 from __future__ import annotations
 
+import struct
+
 
 def make_power_command(on: bool) -> bytes:
     """Build power control command.
@@ -8,8 +10,7 @@ def make_power_command(on: bool) -> bytes:
     Command format from protocol documentation:
     [5, 0, 7, 1, on_byte] where on_byte = 1 for on, 0 for off
     """
-    on_byte = 1 if on else 0
-    return bytes([5, 0, 7, 1, on_byte])
+    return bytes((5, 0, 7, 1, 1 if on else 0))
 
 
 def make_brightness_command(brightness: int) -> bytes:
@@ -34,11 +35,5 @@ def make_brightness_command(brightness: int) -> bytes:
 
 def make_command_payload(opcode: int, payload: bytes) -> bytes:
     """Create command with header (following ipixel-ctrl/common.py format)."""
-    total_length = len(payload) + 4  # +4 for length and opcode
-    
-    command = bytearray()
-    command.extend(total_length.to_bytes(2, 'little'))  # Length (little-endian)
-    command.extend(opcode.to_bytes(2, 'little'))        # Opcode (little-endian)
-    command.extend(payload)                             # Payload data
-    
-    return bytes(command)
\ No newline at end of file
+    # Length (+4 for length and opcode) and opcode, both little-endian
+    return struct.pack("<HH", len(payload) + 4, opcode) + payload
\ No newline at end of file
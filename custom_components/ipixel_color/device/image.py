@@ -1,14 +1,17 @@
 """Image display commands using pypixelcolor."""
 from __future__ import annotations
 
+import binascii
 from typing import Optional
 
 try:
     from pypixelcolor.commands.send_image import send_image_hex
     from pypixelcolor.lib.transport.send_plan import SendPlan
+    from pypixelcolor.lib.device_info import DeviceInfo
 except ImportError:
     send_image_hex = None
     SendPlan = None
+    DeviceInfo = None
 
 
 def make_image_command(
@@ -36,13 +39,13 @@ def make_image_command(
     if send_image_hex is None:
         raise ImportError("pypixelcolor library is not installed")
 
-    # Convert bytes to hex string for pypixelcolor
-    hex_string = image_bytes.hex()
+    # Convert bytes to hex string for pypixelcolor, which takes str input
+    # in every supported version
+    hex_string = binascii.hexlify(image_bytes).decode("ascii")
 
     # Build device_info object from dict if provided
     device_info = None
     if device_info_dict is not None:
-        from pypixelcolor.lib.device_info import DeviceInfo
         device_info = DeviceInfo(
             device_type=device_info_dict.get("device_type", 0),
             mcu_version=device_info_dict.get("mcu_version", "Unknown"),
@@ -63,8 +66,4 @@ def make_image_command(
     )
 
     # Extract command bytes from all windows
-    commands = []
-    for window in send_plan.windows:
-        commands.append(window.data)
-
-    return commands
+    return [window.data for window in send_plan.windows]
@@ -60,8 +60,4 @@ def make_text_command(
 
     # Extract command bytes from all windows
     # send_text may return multiple windows for large text
-    commands = []
-    for window in send_plan.windows:
-        commands.append(window.data)
-
-    return commands
+    return [window.data for window in send_plan.windows]
@@ -4,6 +4,7 @@ from __future__ import annotations
 import io
 import logging
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Tuple
 
@@ -42,20 +43,14 @@ def render_text_to_png(text: str, width: int, height: int, antialias: bool = Tru
         - 255 (white) → text_color
         - Intermediate values → interpolated colors
     """
-    # Create image with device dimensions
-    # Use 'L' mode (grayscale) for non-antialiased to get sharper pixels
-    image_mode = "RGB" if antialias else "1"
-    gray_mode = "L" if antialias else "1"
-    init_zero = (0,0,0) if antialias else 0
-    gray_zero = 0
+    # Create grayscale image with device dimensions, black background
+    # Use '1' mode (1-bit) for non-antialiased to get sharper pixels
+    image_mode = "L" if antialias else "1"
 
     if font_size == 0:
         font_size = None
 
-    if not antialias:
-        img = Image.new(image_mode, (width, height), init_zero)  # 1-bit pixels, black background
-    else:
-        img = Image.new(image_mode, (width, height), init_zero)
+    img = Image.new(image_mode, (width, height), 0)
     draw = ImageDraw.Draw(img)
     
     # Process multiline text
@@ -67,25 +62,17 @@ def render_text_to_png(text: str, width: int, height: int, antialias: bool = Tru
     else:
         font_obj = get_optimal_font(draw, lines, width, height, font, line_spacing)
     
-    # Create temporary image to measure actual content bounds
-    temp_img = Image.new(gray_mode, (width*2, height*2), gray_zero)  # Grayscale for easier analysis
-    temp_draw = ImageDraw.Draw(temp_img)
-    
-    # Draw all text to measure actual content area and calculate per-line bounds
-    temp_y = 0
+    # Measure each line once; the bounds drive both centering and vertical layout.
+    # The draw target shares the font mode of the final image, so bounds match.
     line_data = []
     for line in lines:
-        bbox = temp_draw.textbbox((0, 0), line, font=font_obj)
+        bbox = draw.textbbox((0, 0), line, font=font_obj)
         line_width = bbox[2] - bbox[0]
         line_height = bbox[3] - bbox[1]
-        
-        # Draw line on temporary image
-        temp_draw.text((0, temp_y), line, font=font_obj, fill=255)
 
         l_left, l_top, l_right, l_bottom = (bbox[0], bbox[1], bbox[2], bbox[3])
         line_data.append({
             'text': line,
-            'y_pos': temp_y,
             'content_left': l_left,
             'content_top': l_top,
             'content_right': l_right,
@@ -93,14 +80,13 @@ def render_text_to_png(text: str, width: int, height: int, antialias: bool = Tru
             'content_width': line_width,
             'content_height': line_height
         })
-        temp_y += line_height + line_spacing  # Add line spacing between lines
 
     total_height = sum(data['content_height'] for data in line_data)
     if len(lines) > 1:
         total_height += line_spacing * (len(lines) - 1)
     y_offset = (height - total_height) // 2
 
-    print(line_data)
+    _LOGGER.debug("Line layout: %s", line_data)
     # Draw each line with corrected positioning
     current_y = y_offset
     for i, (line, data) in enumerate(zip(lines, line_data)):
@@ -113,7 +99,7 @@ def render_text_to_png(text: str, width: int, height: int, antialias: bool = Tru
         if not antialias:
             draw.text((x, adjusted_y), line, font=font_obj, fill=1)  # 1 for white in 1-bit mode
         else:
-            draw.text((x, adjusted_y), line, font=font_obj, fill=(255, 255, 255))
+            draw.text((x, adjusted_y), line, font=font_obj, fill=255)
         
         # Move to next line position
         current_y += data['content_height'] + line_spacing  # Add line spacing between lines
@@ -127,39 +113,42 @@ def render_text_to_png(text: str, width: int, height: int, antialias: bool = Tru
         bg_r, bg_g, bg_b = 0, 0, 0
         text_r, text_g, text_b = 255, 255, 255
 
-    # Apply color gradient mapping using linear interpolation
-    # Convert grayscale image to RGB with gradient mapping
-    if not antialias:
-        # For 1-bit images, convert to grayscale first
-        grayscale_img = img.point(lambda x: 255 if x else 0).convert('L')
-    else:
-        # For RGB images, convert to grayscale
-        grayscale_img = img.convert('L')
+    # Apply color gradient mapping using linear interpolation.
+    # The text was drawn in grayscale (1-bit pixels convert to 0/255), so a
+    # single conversion to RGB followed by a per-channel lookup table maps
+    # every pixel in one C-level pass without intermediate copies.
+    lut = _gradient_lut((bg_r, bg_g, bg_b), (text_r, text_g, text_b))
+    rgb_img = img.convert('RGB').point(lut)
 
-    # Create RGB image with interpolated colors
-    rgb_img = Image.new('RGB', (width, height))
-    pixels_gray = grayscale_img.load()
-    pixels_rgb = rgb_img.load()
+    # Convert to PNG bytes. The PNG is sent to the device as-is when it already
+    # matches the display size, so optimize it to minimize bytes sent over BLE.
+    png_buffer = io.BytesIO()
+    rgb_img.save(png_buffer, format='PNG', optimize=True)
+    return png_buffer.getvalue()
 
-    for y in range(height):
-        for x in range(width):
-            # Get grayscale value (0-255)
-            gray_value = pixels_gray[x, y]
 
-            # Linear interpolation: t = gray_value / 255.0
-            # color = bg_color * (1-t) + text_color * t
-            t = gray_value / 255.0
+@lru_cache(maxsize=16)
+def _gradient_lut(bg: tuple[int, int, int], fg: tuple[int, int, int]) -> tuple[int, ...]:
+    """Build a 768-entry RGB lookup table mapping gray levels to colors.
 
-            r = int(bg_r * (1 - t) + text_r * t)
-            g = int(bg_g * (1 - t) + text_g * t)
-            b = int(bg_b * (1 - t) + text_b * t)
+    Uses linear interpolation: t = gray_value / 255.0,
+    color = bg_color * (1-t) + text_color * t
 
-            pixels_rgb[x, y] = (r, g, b)
+    Tables are cached per color pair since colors rarely change between renders.
 
-    # Convert to PNG bytes
-    png_buffer = io.BytesIO()
-    rgb_img.save(png_buffer, format='PNG')
-    return png_buffer.getvalue()
+    Args:
+        bg: Background RGB color (gray value 0)
+        fg: Text RGB color (gray value 255)
+
+    Returns:
+        Lookup table for Image.point() on an RGB image
+    """
+    lut = []
+    for bg_c, fg_c in zip(bg, fg):
+        for gray_value in range(256):
+            t = gray_value / 255.0
+            lut.append(int(bg_c * (1 - t) + fg_c * t))
+    return tuple(lut)
 
 
 def _calculate_content_bounds(img: Image.Image) -> tuple[int, int, int, int] | None:
@@ -226,6 +215,40 @@ def _calculate_content_bounds(img: Image.Image) -> tuple[int, int, int, int] | N
     return left, top, right, bottom
 
 
+@lru_cache(maxsize=32)
+def _find_font(font_name: str) -> Path | None:
+    """Resolve a font name to its file path, memoized per name."""
+    return get_font_path(font_name)
+
+
+def _load_font(font_name: str, size: float) -> ImageFont.FreeTypeFont | None:
+    """Load a TrueType font, resolving its path through the path cache.
+
+    Returns:
+        Font object, or None if the font file could not be found
+    """
+    font_path = _find_font(font_name)
+    if font_path is None:
+        return None
+    return ImageFont.truetype(str(font_path), size)
+
+
+@lru_cache(maxsize=16)
+def _load_fixed_font(font_name: str, size: float) -> ImageFont.FreeTypeFont | None:
+    """Load a font at a fixed size, memoized by (font_name, size).
+
+    Only fixed sizes (user-set sizes, the measuring baseline and the fallback)
+    repeat between renders; the auto-size search sizes depend on the text.
+    """
+    return _load_font(font_name, size)
+
+
+@lru_cache(maxsize=1)
+def _load_default_font() -> ImageFont.ImageFont:
+    """Load Pillow's built-in default font once."""
+    return ImageFont.load_default()
+
+
 def get_fixed_font(size: float, font_name: str | None = None) -> ImageFont.FreeTypeFont:
     """Get font with fixed size.
     
@@ -239,18 +262,18 @@ def get_fixed_font(size: float, font_name: str | None = None) -> ImageFont.FreeT
     try:
         # Try to load custom font from fonts/ folder first
         if font_name:
-            font_path = get_font_path(font_name)
-            if font_path:
-                try:
-                    return ImageFont.truetype(str(font_path), size)
-                except Exception as e:
-                    _LOGGER.warning("Could not load custom font %s: %s", font_name, e)
+            try:
+                font = _load_fixed_font(font_name, size)
+                if font is not None:
+                    return font
+            except Exception as e:
+                _LOGGER.warning("Could not load custom font %s: %s", font_name, e)
 
         # Use default font if custom font failed or not specified
-        return ImageFont.load_default()
+        return _load_default_font()
     except Exception as e:
         _LOGGER.warning("Error loading font size %.1f: %s, using default", size, e)
-        return ImageFont.load_default()
+        return _load_default_font()
 
 
 def get_optimal_font(draw: ImageDraw.Draw, lines: list[str], 
@@ -281,10 +304,12 @@ def get_optimal_font(draw: ImageDraw.Draw, lines: list[str],
     baseline_width = bbox[2] - bbox[0]
     baseline_line_height = bbox[3] - bbox[1]
     
+    # Spacing between lines does not depend on font size, compute it once
+    spacing_height = line_spacing * (len(lines) - 1) if len(lines) > 1 else 0
+    max_size = min(max_height, max_width)
+
     # Calculate total height with line spacing
-    total_baseline_height = baseline_line_height * len(lines)
-    if len(lines) > 1:
-        total_baseline_height += line_spacing * (len(lines) - 1)
+    total_baseline_height = baseline_line_height * len(lines) + spacing_height
     
     # Calculate theoretical optimal size based on proportions
     width_ratio = max_width / baseline_width if baseline_width > 0 else 1.0
@@ -292,7 +317,7 @@ def get_optimal_font(draw: ImageDraw.Draw, lines: list[str],
     theoretical_size = baseline_size * min(width_ratio, height_ratio)
     
     # Clamp to reasonable range
-    theoretical_size = max(1.0, min(theoretical_size, min(max_height, max_width)))
+    theoretical_size = max(1.0, min(theoretical_size, max_size))
     
     _LOGGER.debug("Theoretical optimal size: %.1f (width_ratio: %.2f, height_ratio: %.2f)",
                  theoretical_size, width_ratio, height_ratio)
@@ -313,28 +338,30 @@ def get_optimal_font(draw: ImageDraw.Draw, lines: list[str],
             break  # Skip refinement if no valid size found
             
         current_start = max(1.0, start if iteration == 0 else start)
-        current_end = min(min(max_height, max_width), end if iteration == 0 else end)
+        current_end = min(max_size, end if iteration == 0 else end)
         
+        # Sizes at or below the best fit so far cannot improve on it
         size = current_start
+        while size <= best_size:
+            size += step
+
         while size <= current_end:
             try:
                 # Try to load font at this size
                 font = None
                 if font_name:
-                    font_path = get_font_path(font_name)
-                    if font_path:
-                        try:
-                            font = ImageFont.truetype(str(font_path), size)
-                        except Exception as e:
-                            _LOGGER.debug("Custom font %s failed at size %.1f: %s", font_name, size, e)
+                    try:
+                        font = _load_font(font_name, size)
+                    except Exception as e:
+                        _LOGGER.debug("Custom font %s failed at size %.1f: %s", font_name, size, e)
                 
                 # Use default font if custom font failed or not specified
                 if font is None:
-                    font = ImageFont.load_default()
+                    font = _load_default_font()
                 
                 # Check if all lines fit within dimensions
                 fits = True
-                total_height = 0
+                total_height = spacing_height
                 
                 for line in lines:
                     bbox = draw.textbbox((0, 0), line, font=font)
@@ -348,19 +375,18 @@ def get_optimal_font(draw: ImageDraw.Draw, lines: list[str],
                         
                     total_height += text_height
                 
-                # Add line spacing to total height
-                if len(lines) > 1:
-                    total_height += line_spacing * (len(lines) - 1)
-                
                 # Check if all lines fit vertically
                 if total_height > max_height:
                     fits = False
                 
-                if fits and size > best_size:
-                    best_size = size
-                    best_font = font
-                    _LOGGER.debug("Iteration %d: Found better size: %.1f (total height: %d/%d)", 
-                                iteration + 1, size, total_height, max_height)
+                if not fits:
+                    # Text only grows with font size, so no larger size in this pass fits
+                    break
+
+                best_size = size
+                best_font = font
+                _LOGGER.debug("Iteration %d: Found better size: %.1f (total height: %d/%d)", 
+                            iteration + 1, size, total_height, max_height)
                     
             except Exception as e:
                 _LOGGER.debug("Font size %.1f failed: %s", size, e)
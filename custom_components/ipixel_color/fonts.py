@@ -2,10 +2,15 @@
 from __future__ import annotations
 
 import logging
+import os
+from functools import lru_cache
 from pathlib import Path
 
 _LOGGER = logging.getLogger(__name__)
 
+# Fonts shipped with this integration, resolved once at import
+CUSTOM_FONTS_DIR = Path(__file__).parent / "fonts"
+
 
 def get_font_locations() -> list[Path]:
     """Get list of font directories sorted by priority.
@@ -21,10 +26,9 @@ def get_font_locations() -> list[Path]:
     locations = []
 
     # 1st priority: Custom fonts from this integration
-    custom_fonts_dir = Path(__file__).parent / "fonts"
-    if custom_fonts_dir.exists() and custom_fonts_dir.is_dir():
-        locations.append(custom_fonts_dir)
-        _LOGGER.debug("Added custom fonts directory: %s", custom_fonts_dir)
+    if CUSTOM_FONTS_DIR.is_dir():
+        locations.append(CUSTOM_FONTS_DIR)
+        _LOGGER.debug("Added custom fonts directory: %s", CUSTOM_FONTS_DIR)
 
     # 2nd priority: pypixelcolor package fonts
     try:
@@ -57,6 +61,24 @@ def get_font_locations() -> list[Path]:
     return locations
 
 
+@lru_cache(maxsize=1)
+def get_custom_font_names() -> frozenset[str]:
+    """Get the font filenames bundled in this integration's fonts/ folder.
+
+    The folder only changes when the integration is updated, so it is listed
+    once instead of checking the file system on every display update.
+
+    Returns:
+        Set of font filenames in the custom fonts directory
+    """
+    try:
+        with os.scandir(CUSTOM_FONTS_DIR) as entries:
+            return frozenset(entry.name for entry in entries if entry.is_file())
+    except OSError as e:
+        _LOGGER.debug("Could not scan directory %s: %s", CUSTOM_FONTS_DIR, e)
+        return frozenset()
+
+
 def get_font_path(font_name: str, locations: list[Path] | None = None) -> Path | None:
     """Find font file in available font locations.
 
@@ -109,22 +131,9 @@ def get_available_fonts(locations: list[Path] | None = None) -> list[str]:
     # Scan each location for fonts
     for location in locations:
         try:
-            # Scan for TTF fonts
-            for font_file in location.glob("*.ttf"):
-                fonts.add(font_file.name)
-
-            # Scan for OTF fonts
-            for font_file in location.glob("*.otf"):
-                fonts.add(font_file.name)
-
-            # Also check subdirectories (for system fonts)
-            for font_file in location.rglob("*.ttf"):
-                if font_file.is_file():
-                    fonts.add(font_file.name)
-
-            for font_file in location.rglob("*.otf"):
-                if font_file.is_file():
-                    fonts.add(font_file.name)
+            # Single walk over the location and its subdirectories (for system fonts)
+            for _root, _dirs, files in os.walk(location):
+                fonts.update(name for name in files if name.endswith((".ttf", ".otf")))
 
         except (OSError, PermissionError) as e:
             _LOGGER.debug("Could not scan directory %s: %s", location, e)
@@ -134,4 +143,18 @@ def get_available_fonts(locations: list[Path] | None = None) -> list[str]:
         fonts.add("OpenSans-Light.ttf")
 
     _LOGGER.debug("Found %d unique fonts across all locations", len(fonts))
-    return sorted(list(fonts))
+    return sorted(fonts)
+
+
+@lru_cache(maxsize=1)
+def get_cached_available_fonts() -> tuple[str, ...]:
+    """Get available fonts from the default locations, scanning only once.
+
+    The font directories rarely change at runtime, so the result of the
+    first (blocking) scan is reused by every later config entry setup.
+    Call it from an executor job since the first call walks the disk.
+
+    Returns:
+        Sorted tuple of unique font filenames
+    """
+    return tuple(get_available_fonts())
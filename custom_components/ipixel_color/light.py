@@ -13,13 +13,12 @@ from homeassistant.components.light import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.restore_state import RestoreEntity
 
 from .api import iPIXELAPI
 from .const import DOMAIN, CONF_ADDRESS, CONF_NAME
 from .color import rgb_to_hex
-from .common import get_entity_id_by_unique_id
+from .common import build_device_info, get_entity_id_by_unique_id, is_entity_on, update_ipixel_display
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -68,19 +67,14 @@ class iPIXELColorLight(LightEntity, RestoreEntity):
         self._address = address
         self._device_name = name
         self._attr_name = self._light_name  # Just the light name, device name is redundant
+        self._log_name = self._light_name.lower()  # Lowercase label for log messages
         self._attr_unique_id = f"{address}_{self._entity_suffix}"
         self._attr_is_on = True  # Start as "on"
         self._attr_rgb_color = self._default_rgb
         self._attr_brightness = 255  # Full brightness by default
 
         # Device info for grouping in device registry
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, address)},
-            name=name,
-            manufacturer="iPIXEL",
-            model="LED Matrix Display",
-            sw_version="1.0",
-        )
+        self._attr_device_info = build_device_info(address, name)
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -91,16 +85,16 @@ class iPIXELColorLight(LightEntity, RestoreEntity):
         if last_state is not None:
             # Restore on/off state
             self._attr_is_on = last_state.state == "on"
-            _LOGGER.debug("Restored %s state: %s", self._light_name.lower(), last_state.state)
+            _LOGGER.debug("Restored %s state: %s", self._log_name, last_state.state)
 
             if last_state.attributes.get(ATTR_RGB_COLOR):
                 rgb = last_state.attributes[ATTR_RGB_COLOR]
                 self._attr_rgb_color = tuple(rgb)
-                _LOGGER.debug("Restored %s: RGB%s", self._light_name.lower(), self._attr_rgb_color)
+                _LOGGER.debug("Restored %s: RGB%s", self._log_name, self._attr_rgb_color)
 
             if last_state.attributes.get(ATTR_BRIGHTNESS):
                 self._attr_brightness = last_state.attributes[ATTR_BRIGHTNESS]
-                _LOGGER.debug("Restored %s brightness: %d", self._light_name.lower(), self._attr_brightness)
+                _LOGGER.debug("Restored %s brightness: %d", self._log_name, self._attr_brightness)
 
     @property
     def is_on(self) -> bool:
@@ -163,23 +157,19 @@ class iPIXELColorLight(LightEntity, RestoreEntity):
         if not self._trigger_modes:
             return
 
-        try:
-            from .common import update_ipixel_display
-
-            # Check if we're in one of the trigger modes
-            mode_entity_id = get_entity_id_by_unique_id(self.hass, self._address, "mode_select", "select")
-            mode_state = self.hass.states.get(mode_entity_id) if mode_entity_id else None
+        # Check if we're in one of the trigger modes
+        mode_entity_id = get_entity_id_by_unique_id(self.hass, self._address, "mode_select", "select")
+        mode_state = self.hass.states.get(mode_entity_id) if mode_entity_id else None
+        if mode_state is None or mode_state.state not in self._trigger_modes:
+            return
 
-            if mode_state and mode_state.state in self._trigger_modes:
-                # Check auto-update setting
-                auto_update_entity_id = get_entity_id_by_unique_id(self.hass, self._address, "auto_update", "switch")
-                auto_update_state = self.hass.states.get(auto_update_entity_id) if auto_update_entity_id else None
+        # Check auto-update setting
+        auto_update_entity_id = get_entity_id_by_unique_id(self.hass, self._address, "auto_update", "switch")
+        if not is_entity_on(self.hass, auto_update_entity_id):
+            return
 
-                if auto_update_state and auto_update_state.state == "on":
-                    await update_ipixel_display(self.hass, self._device_name, self._api)
-                    _LOGGER.debug("Auto-update triggered due to %s change", self._light_name.lower())
-        except Exception as err:
-            _LOGGER.debug("Could not trigger auto-update: %s", err)
+        await update_ipixel_display(self.hass, self._device_name, self._api)
+        _LOGGER.debug("Auto-update triggered due to %s change", self._log_name)
 
 
 class iPIXELTextColorLight(iPIXELColorLight):
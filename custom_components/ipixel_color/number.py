@@ -8,12 +8,11 @@ from homeassistant.components.number import NumberEntity, NumberMode
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.restore_state import RestoreEntity
 
 from .api import iPIXELAPI
 from .const import DOMAIN, CONF_ADDRESS, CONF_NAME
-from .common import get_entity_id_by_unique_id
+from .common import build_device_info, get_entity_id_by_unique_id, is_entity_on, state_to_int, update_ipixel_display
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,6 +28,8 @@ async def async_setup_entry(
     
     api = hass.data[DOMAIN][entry.entry_id]
     
+    # Add every entity in one call so the platform schedules them together;
+    # new entities belong in this list rather than a second call
     async_add_entities([
         iPIXELFontSize(api, entry, address, name),
         iPIXELLineSpacing(api, entry, address, name),
@@ -64,16 +65,9 @@ class iPIXELFontSize(NumberEntity, RestoreEntity):
         self._attr_name = "Font Size"
         self._attr_unique_id = f"{address}_font_size"
         self._attr_native_value = 0.0  # 0 means auto-sizing
-        self._attr_entity_description = "Font size in pixels (0 = auto-sizing, supports decimals)"
         
         # Device info for grouping in device registry
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, address)},
-            name=name,
-            manufacturer="iPIXEL",
-            model="LED Matrix Display",
-            sw_version="1.0",
-        )
+        self._attr_device_info = build_device_info(address, name)
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -137,16 +131,9 @@ class iPIXELLineSpacing(NumberEntity, RestoreEntity):
         self._attr_name = "Line Spacing"
         self._attr_unique_id = f"{address}_line_spacing"
         self._attr_native_value = 0  # Default to no extra spacing
-        self._attr_entity_description = "Extra spacing between lines in pixels (for multiline text)"
         
         # Device info for grouping in device registry
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, address)},
-            name=name,
-            manufacturer="iPIXEL",
-            model="LED Matrix Display",
-            sw_version="1.0",
-        )
+        self._attr_device_info = build_device_info(address, name)
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -156,7 +143,7 @@ class iPIXELLineSpacing(NumberEntity, RestoreEntity):
         last_state = await self.async_get_last_state()
         if last_state is not None and last_state.state not in ("unknown", "unavailable"):
             try:
-                self._attr_native_value = int(float(last_state.state))
+                self._attr_native_value = state_to_int(last_state.state)
                 _LOGGER.debug("Restored line spacing: %d", self._attr_native_value)
             except (ValueError, TypeError):
                 _LOGGER.warning("Could not restore line spacing from: %s", last_state.state)
@@ -170,7 +157,7 @@ class iPIXELLineSpacing(NumberEntity, RestoreEntity):
         """Set the line spacing."""
         if self._attr_native_min_value <= value <= self._attr_native_max_value:
             self._attr_native_value = int(value)
-            _LOGGER.debug("Line spacing changed to: %d pixels", int(value))
+            _LOGGER.debug("Line spacing changed to: %d pixels", self._attr_native_value)
             # Note: The actual line spacing will be used when text is displayed
         else:
             _LOGGER.error("Invalid line spacing: %f (min: %f, max: %f)", 
@@ -207,16 +194,9 @@ class iPIXELBrightness(NumberEntity, RestoreEntity):
         self._attr_name = "Brightness"
         self._attr_unique_id = f"{address}_brightness"
         self._attr_native_value = 50  # Default brightness is 50%
-        self._attr_entity_description = "Display brightness level (1-100)"
         
         # Device info for grouping in device registry
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, address)},
-            name=name,
-            manufacturer="iPIXEL",
-            model="LED Matrix Display",
-            sw_version="1.0",
-        )
+        self._attr_device_info = build_device_info(address, name)
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -226,7 +206,7 @@ class iPIXELBrightness(NumberEntity, RestoreEntity):
         last_state = await self.async_get_last_state()
         if last_state is not None and last_state.state not in ("unknown", "unavailable"):
             try:
-                value = int(float(last_state.state))
+                value = state_to_int(last_state.state)
                 if 1 <= value <= 100:
                     self._attr_native_value = value
                     _LOGGER.debug("Restored brightness: %d", self._attr_native_value)
@@ -259,11 +239,6 @@ class iPIXELBrightness(NumberEntity, RestoreEntity):
         else:
             _LOGGER.error("Invalid brightness: %d (must be 1-100)", brightness)
 
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return True
-
 
 class iPIXELTextAnimation(NumberEntity, RestoreEntity):
     """Representation of an iPIXEL Color text animation setting."""
@@ -290,15 +265,14 @@ class iPIXELTextAnimation(NumberEntity, RestoreEntity):
         self._name = name
         self._attr_name = "Text Animation"
         self._attr_unique_id = f"{address}_text_animation"
+
+        # Entity ids checked on every change, derived from the device name once
+        slug = name.lower().replace(' ', '_')
+        self._mode_eid = f"select.{slug}_mode"
+        self._auto_update_eid = f"switch.{slug}_auto_update"
         self._attr_native_value = 0  # Default to no animation
 
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, address)},
-            name=name,
-            manufacturer="iPIXEL",
-            model="LED Matrix Display",
-            sw_version="1.0",
-        )
+        self._attr_device_info = build_device_info(address, name)
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -307,7 +281,7 @@ class iPIXELTextAnimation(NumberEntity, RestoreEntity):
         last_state = await self.async_get_last_state()
         if last_state is not None and last_state.state:
             try:
-                value = int(float(last_state.state))
+                value = state_to_int(last_state.state)
                 if 0 <= value <= 7:
                     self._attr_native_value = value
             except (ValueError, TypeError):
@@ -325,20 +299,14 @@ class iPIXELTextAnimation(NumberEntity, RestoreEntity):
 
     async def _trigger_auto_update(self) -> None:
         """Trigger display update if auto-update is enabled and in text mode."""
-        try:
-            from .common import update_ipixel_display
+        mode_state = self.hass.states.get(self._mode_eid)
+        if mode_state is None or mode_state.state != "text":
+            return
 
-            mode_entity_id = f"select.{self._name.lower().replace(' ', '_')}_mode"
-            mode_state = self.hass.states.get(mode_entity_id) if mode_entity_id else None
+        if not is_entity_on(self.hass, self._auto_update_eid):
+            return
 
-            if mode_state and mode_state.state == "text":
-                auto_update_entity_id = f"switch.{self._name.lower().replace(' ', '_')}_auto_update"
-                auto_update_state = self.hass.states.get(auto_update_entity_id) if auto_update_entity_id else None
-
-                if auto_update_state and auto_update_state.state == "on":
-                    await update_ipixel_display(self.hass, self._name, self._api)
-        except Exception as err:
-            _LOGGER.debug("Could not trigger auto-update: %s", err)
+        await update_ipixel_display(self.hass, self._name, self._api)
 
     @property
     def available(self) -> bool:
@@ -371,15 +339,14 @@ class iPIXELTextSpeed(NumberEntity, RestoreEntity):
         self._name = name
         self._attr_name = "Text Speed"
         self._attr_unique_id = f"{address}_text_speed"
+
+        # Entity ids checked on every change, derived from the device name once
+        slug = name.lower().replace(' ', '_')
+        self._mode_eid = f"select.{slug}_mode"
+        self._auto_update_eid = f"switch.{slug}_auto_update"
         self._attr_native_value = 80  # Default speed
 
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, address)},
-            name=name,
-            manufacturer="iPIXEL",
-            model="LED Matrix Display",
-            sw_version="1.0",
-        )
+        self._attr_device_info = build_device_info(address, name)
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -388,7 +355,7 @@ class iPIXELTextSpeed(NumberEntity, RestoreEntity):
         last_state = await self.async_get_last_state()
         if last_state is not None and last_state.state:
             try:
-                value = int(float(last_state.state))
+                value = state_to_int(last_state.state)
                 if 0 <= value <= 100:
                     self._attr_native_value = value
             except (ValueError, TypeError):
@@ -406,20 +373,14 @@ class iPIXELTextSpeed(NumberEntity, RestoreEntity):
 
     async def _trigger_auto_update(self) -> None:
         """Trigger display update if auto-update is enabled and in text mode."""
-        try:
-            from .common import update_ipixel_display
-
-            mode_entity_id = f"select.{self._name.lower().replace(' ', '_')}_mode"
-            mode_state = self.hass.states.get(mode_entity_id) if mode_entity_id else None
+        mode_state = self.hass.states.get(self._mode_eid)
+        if mode_state is None or mode_state.state != "text":
+            return
 
-            if mode_state and mode_state.state == "text":
-                auto_update_entity_id = f"switch.{self._name.lower().replace(' ', '_')}_auto_update"
-                auto_update_state = self.hass.states.get(auto_update_entity_id) if auto_update_entity_id else None
+        if not is_entity_on(self.hass, self._auto_update_eid):
+            return
 
-                if auto_update_state and auto_update_state.state == "on":
-                    await update_ipixel_display(self.hass, self._name, self._api)
-        except Exception as err:
-            _LOGGER.debug("Could not trigger auto-update: %s", err)
+        await update_ipixel_display(self.hass, self._name, self._api)
 
     @property
     def available(self) -> bool:
@@ -452,15 +413,14 @@ class iPIXELTextRainbow(NumberEntity, RestoreEntity):
         self._name = name
         self._attr_name = "Text Rainbow"
         self._attr_unique_id = f"{address}_text_rainbow"
+
+        # Entity ids checked on every change, derived from the device name once
+        slug = name.lower().replace(' ', '_')
+        self._mode_eid = f"select.{slug}_mode"
+        self._auto_update_eid = f"switch.{slug}_auto_update"
         self._attr_native_value = 0  # Default to no rainbow
 
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, address)},
-            name=name,
-            manufacturer="iPIXEL",
-            model="LED Matrix Display",
-            sw_version="1.0",
-        )
+        self._attr_device_info = build_device_info(address, name)
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -469,7 +429,7 @@ class iPIXELTextRainbow(NumberEntity, RestoreEntity):
         last_state = await self.async_get_last_state()
         if last_state is not None and last_state.state:
             try:
-                value = int(float(last_state.state))
+                value = state_to_int(last_state.state)
                 if 0 <= value <= 9:
                     self._attr_native_value = value
             except (ValueError, TypeError):
@@ -487,20 +447,14 @@ class iPIXELTextRainbow(NumberEntity, RestoreEntity):
 
     async def _trigger_auto_update(self) -> None:
         """Trigger display update if auto-update is enabled and in text mode."""
-        try:
-            from .common import update_ipixel_display
-
-            mode_entity_id = f"select.{self._name.lower().replace(' ', '_')}_mode"
-            mode_state = self.hass.states.get(mode_entity_id) if mode_entity_id else None
+        mode_state = self.hass.states.get(self._mode_eid)
+        if mode_state is None or mode_state.state != "text":
+            return
 
-            if mode_state and mode_state.state == "text":
-                auto_update_entity_id = f"switch.{self._name.lower().replace(' ', '_')}_auto_update"
-                auto_update_state = self.hass.states.get(auto_update_entity_id) if auto_update_entity_id else None
+        if not is_entity_on(self.hass, self._auto_update_eid):
+            return
 
-                if auto_update_state and auto_update_state.state == "on":
-                    await update_ipixel_display(self.hass, self._name, self._api)
-        except Exception as err:
-            _LOGGER.debug("Could not trigger auto-update: %s", err)
+        await update_ipixel_display(self.hass, self._name, self._api)
 
     @property
     def available(self) -> bool:
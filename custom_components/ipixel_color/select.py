@@ -2,25 +2,35 @@
 from __future__ import annotations
 
 import logging
-import os
-from pathlib import Path
 from typing import Any
 
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.restore_state import RestoreEntity
 
 from .api import iPIXELAPI
-from .const import DOMAIN, CONF_ADDRESS, CONF_NAME, AVAILABLE_MODES, DEFAULT_MODE
-from .common import get_entity_id_by_unique_id
+from .const import (
+    DOMAIN,
+    CONF_ADDRESS,
+    CONF_NAME,
+    AVAILABLE_MODES,
+    DEFAULT_MODE,
+    CLOCK_STYLES,
+    DEFAULT_CLOCK_STYLE,
+    DEFAULT_FONT,
+)
+from .common import build_device_info, get_entity_id_by_unique_id, is_entity_on
 from .common import update_ipixel_display
-from .fonts import get_available_fonts
+from .fonts import get_cached_available_fonts
 
 _LOGGER = logging.getLogger(__name__)
 
+# Fixed option sets, shared by every entity for membership checks
+_MODES_SET = frozenset(AVAILABLE_MODES)
+_CLOCK_STYLES_SET = frozenset(CLOCK_STYLES)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -33,6 +43,8 @@ async def async_setup_entry(
     
     api = hass.data[DOMAIN][entry.entry_id]
     
+    # Add every entity in one call so the platform schedules them together;
+    # new entities belong in this list rather than a second call
     async_add_entities([
         iPIXELFontSelect(hass, api, entry, address, name),
         iPIXELModeSelect(hass, api, entry, address, name),
@@ -59,65 +71,60 @@ class iPIXELFontSelect(SelectEntity, RestoreEntity):
         self._name = name
         self._attr_name = "Font"
         self._attr_unique_id = f"{address}_font_select"
-        self._attr_entity_description = "Select font for text display"
 
-        # Get available fonts from all locations
-        self._attr_options = get_available_fonts()
-        self._attr_current_option = "OpenSans-Light.ttf" if "OpenSans-Light.ttf" in self._attr_options else self._attr_options[0]
+        # Only the bundled default font until the font scan in async_added_to_hass
+        self._attr_current_option = DEFAULT_FONT
+        self._attr_options = [self._attr_current_option]
+        # Font lists can be long, validate selections against a set
+        self._options_set = frozenset(self._attr_options)
         
         # Device info for grouping in device registry
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, address)},
-            name=name,
-            manufacturer="iPIXEL",
-            model="LED Matrix Display",
-            sw_version="1.0",
-        )
+        self._attr_device_info = build_device_info(address, name)
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
         await super().async_added_to_hass()
-        
-        # Restore last state if available
+
+        # Scan font directories in the executor, this still runs during
+        # platform setup but keeps the disk walk off the event loop
+        fonts = await self.hass.async_add_executor_job(get_cached_available_fonts)
+        self._attr_options = list(fonts)
+        self._options_set = frozenset(fonts)
+
+        # Restore last state if the font is still installed, otherwise keep
+        # the bundled default when it was found
         last_state = await self.async_get_last_state()
-        if last_state is not None and last_state.state in self._attr_options:
+        if last_state is not None and last_state.state in self._options_set:
             self._attr_current_option = last_state.state
             _LOGGER.debug("Restored font selection: %s", self._attr_current_option)
-
-    @property
-    def current_option(self) -> str | None:
-        """Return the current selected font."""
-        return self._attr_current_option
+        elif DEFAULT_FONT in self._options_set:
+            self._attr_current_option = DEFAULT_FONT
+        else:
+            self._attr_current_option = self._attr_options[0]
 
     async def async_select_option(self, option: str) -> None:
         """Select a font option."""
-        if option in self._attr_options:
+        # Reselecting the current option has nothing to refresh
+        if option == self._attr_current_option:
+            return
+        if option in self._options_set:
             self._attr_current_option = option
             _LOGGER.debug("Font changed to: %s", option)
             
-            # Trigger display update if auto-update is enabled
-            await self._trigger_auto_update()
+            # Refresh the display in the background so the selection returns immediately
+            self.hass.async_create_task(self._trigger_auto_update())
         else:
             _LOGGER.error("Invalid font option: %s", option)
 
     async def _trigger_auto_update(self) -> None:
         """Trigger display update if auto-update is enabled."""
-        try:
-            # Check auto-update setting
-            auto_update_entity_id = get_entity_id_by_unique_id(self.hass, self._address, "auto_update", "switch")
-            auto_update_state = self.hass.states.get(auto_update_entity_id) if auto_update_entity_id else None
-            
-            if auto_update_state and auto_update_state.state == "on":
-                # Use common update function directly
-                await update_ipixel_display(self.hass, self._name, self._api)
-                _LOGGER.debug("Auto-update triggered display refresh due to font change")
-        except Exception as err:
-            _LOGGER.debug("Could not trigger auto-update: %s", err)
+        # Check auto-update setting
+        auto_update_entity_id = get_entity_id_by_unique_id(self.hass, self._address, "auto_update", "switch")
+        if not is_entity_on(self.hass, auto_update_entity_id):
+            return
 
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return True
+        await update_ipixel_display(self.hass, self._name, self._api)
+        _LOGGER.debug("Auto-update triggered display refresh due to font change")
 
 
 class iPIXELModeSelect(SelectEntity, RestoreEntity):
@@ -139,20 +146,14 @@ class iPIXELModeSelect(SelectEntity, RestoreEntity):
         self._name = name
         self._attr_name = "Mode"
         self._attr_unique_id = f"{address}_mode_select"
-        self._attr_entity_description = "Select display mode (textimage, clock, rhythm, fun)"
 
         # Set available mode options
         self._attr_options = AVAILABLE_MODES
+        self._options_set = _MODES_SET
         self._attr_current_option = DEFAULT_MODE
 
         # Device info for grouping in device registry
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, address)},
-            name=name,
-            manufacturer="iPIXEL",
-            model="LED Matrix Display",
-            sw_version="1.0",
-        )
+        self._attr_device_info = build_device_info(address, name)
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -160,18 +161,16 @@ class iPIXELModeSelect(SelectEntity, RestoreEntity):
 
         # Restore last state if available
         last_state = await self.async_get_last_state()
-        if last_state is not None and last_state.state in self._attr_options:
+        if last_state is not None and last_state.state in self._options_set:
             self._attr_current_option = last_state.state
             _LOGGER.debug("Restored mode selection: %s", self._attr_current_option)
 
-    @property
-    def current_option(self) -> str | None:
-        """Return the current selected mode."""
-        return self._attr_current_option
-
     async def async_select_option(self, option: str) -> None:
         """Select a mode option."""
-        if option in self._attr_options:
+        # Reselecting the current option has nothing to refresh
+        if option == self._attr_current_option:
+            return
+        if option in self._options_set:
             self._attr_current_option = option
             _LOGGER.info("Mode changed to: %s", option)
 
@@ -182,22 +181,13 @@ class iPIXELModeSelect(SelectEntity, RestoreEntity):
 
     async def _trigger_auto_update(self) -> None:
         """Trigger display update if auto-update is enabled."""
-        try:
-            # Check auto-update setting
-            auto_update_entity_id = get_entity_id_by_unique_id(self.hass, self._address, "auto_update", "switch")
-            auto_update_state = self.hass.states.get(auto_update_entity_id) if auto_update_entity_id else None
-
-            if auto_update_state and auto_update_state.state == "on":
-                # Use common update function directly
-                await update_ipixel_display(self.hass, self._name, self._api)
-                _LOGGER.debug("Auto-update triggered display refresh due to mode change")
-        except Exception as err:
-            _LOGGER.debug("Could not trigger auto-update: %s", err)
+        # Check auto-update setting
+        auto_update_entity_id = get_entity_id_by_unique_id(self.hass, self._address, "auto_update", "switch")
+        if not is_entity_on(self.hass, auto_update_entity_id):
+            return
 
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return True
+        await update_ipixel_display(self.hass, self._name, self._api)
+        _LOGGER.debug("Auto-update triggered display refresh due to mode change")
 
 
 class iPIXELClockStyleSelect(SelectEntity, RestoreEntity):
@@ -219,20 +209,14 @@ class iPIXELClockStyleSelect(SelectEntity, RestoreEntity):
         self._name = name
         self._attr_name = "Clock Style"
         self._attr_unique_id = f"{address}_clock_style_select"
-        self._attr_entity_description = "Select clock display style (0-8)"
 
         # Clock styles 0-8
-        self._attr_options = ["0", "1", "2", "3", "4", "5", "6", "7", "8"]
-        self._attr_current_option = "1"  # Default style
+        self._attr_options = CLOCK_STYLES
+        self._options_set = _CLOCK_STYLES_SET
+        self._attr_current_option = DEFAULT_CLOCK_STYLE
 
         # Device info for grouping in device registry
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, address)},
-            name=name,
-            manufacturer="iPIXEL",
-            model="LED Matrix Display",
-            sw_version="1.0",
-        )
+        self._attr_device_info = build_device_info(address, name)
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -240,18 +224,16 @@ class iPIXELClockStyleSelect(SelectEntity, RestoreEntity):
 
         # Restore last state if available
         last_state = await self.async_get_last_state()
-        if last_state is not None and last_state.state in self._attr_options:
+        if last_state is not None and last_state.state in self._options_set:
             self._attr_current_option = last_state.state
             _LOGGER.debug("Restored clock style selection: %s", self._attr_current_option)
 
-    @property
-    def current_option(self) -> str | None:
-        """Return the current selected clock style."""
-        return self._attr_current_option
-
     async def async_select_option(self, option: str) -> None:
         """Select a clock style option."""
-        if option in self._attr_options:
+        # Reselecting the current option has nothing to refresh
+        if option == self._attr_current_option:
+            return
+        if option in self._options_set:
             self._attr_current_option = option
             _LOGGER.info("Clock style changed to: %s", option)
 
@@ -262,24 +244,16 @@ class iPIXELClockStyleSelect(SelectEntity, RestoreEntity):
 
     async def _trigger_auto_update(self) -> None:
         """Trigger display update if auto-update is enabled and in clock mode."""
-        try:
-            # Check if we're in clock mode
-            mode_entity_id = get_entity_id_by_unique_id(self.hass, self._address, "mode_select", "select")
-            mode_state = self.hass.states.get(mode_entity_id) if mode_entity_id else None
-
-            if mode_state and mode_state.state == "clock":
-                # Check auto-update setting
-                auto_update_entity_id = get_entity_id_by_unique_id(self.hass, self._address, "auto_update", "switch")
-                auto_update_state = self.hass.states.get(auto_update_entity_id) if auto_update_entity_id else None
-
-                if auto_update_state and auto_update_state.state == "on":
-                    # Use common update function directly
-                    await update_ipixel_display(self.hass, self._name, self._api)
-                    _LOGGER.debug("Auto-update triggered display refresh due to clock style change")
-        except Exception as err:
-            _LOGGER.debug("Could not trigger auto-update: %s", err)
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return True
\ No newline at end of file
+        # Check if we're in clock mode
+        mode_entity_id = get_entity_id_by_unique_id(self.hass, self._address, "mode_select", "select")
+        mode_state = self.hass.states.get(mode_entity_id) if mode_entity_id else None
+        if mode_state is None or mode_state.state != "clock":
+            return
+
+        # Check auto-update setting
+        auto_update_entity_id = get_entity_id_by_unique_id(self.hass, self._address, "auto_update", "switch")
+        if not is_entity_on(self.hass, auto_update_entity_id):
+            return
+
+        await update_ipixel_display(self.hass, self._name, self._api)
+        _LOGGER.debug("Auto-update triggered display refresh due to clock style change")
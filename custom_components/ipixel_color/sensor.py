@@ -12,10 +12,11 @@ from homeassistant.components.sensor import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.entity import DeviceInfo, EntityCategory
+from homeassistant.helpers.entity import EntityCategory
 
 from .api import iPIXELAPI, iPIXELConnectionError
 from .const import DOMAIN, CONF_ADDRESS, CONF_NAME
+from .common import build_device_info
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -67,9 +68,10 @@ async def async_setup_entry(
     api = hass.data[DOMAIN][entry.entry_id]
     
     # Create sensor entities
-    sensors = []
-    for description in SENSOR_DESCRIPTIONS:
-        sensors.append(iPIXELSensor(api, entry, address, name, description))
+    sensors = [
+        iPIXELSensor(api, entry, address, name, description)
+        for description in SENSOR_DESCRIPTIONS
+    ]
     
     async_add_entities(sensors)
 
@@ -98,13 +100,7 @@ class iPIXELSensor(SensorEntity):
         self._available = True
 
         # Device info for grouping in device registry
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, address)},
-            name=name,
-            manufacturer="iPIXEL",
-            model="LED Matrix Display",
-            sw_version="1.0",
-        )
+        self._attr_device_info = build_device_info(address, name)
 
     @property
     def available(self) -> bool:
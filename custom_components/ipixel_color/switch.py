@@ -8,12 +8,11 @@ from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.restore_state import RestoreEntity
 
 from .api import iPIXELAPI, iPIXELConnectionError
 from .const import DOMAIN, CONF_ADDRESS, CONF_NAME
-from .common import get_entity_id_by_unique_id
+from .common import build_device_info, get_entity_id_by_unique_id, is_entity_on
 from .common import update_ipixel_display
 
 _LOGGER = logging.getLogger(__name__)
@@ -60,13 +59,7 @@ class iPIXELSwitch(SwitchEntity):
         self._available = True
 
         # Device info for grouping in device registry
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, address)},
-            name=name,
-            manufacturer="iPIXEL",
-            model="LED Matrix Display",
-            sw_version="1.0",
-        )
+        self._attr_device_info = build_device_info(address, name)
 
     @property
     def is_on(self) -> bool:
@@ -156,17 +149,10 @@ class iPIXELAntialiasingSwitch(SwitchEntity, RestoreEntity):
         self._name = name
         self._attr_name = "Antialiasing"
         self._attr_unique_id = f"{address}_antialiasing"
-        self._attr_entity_description = "Enable text antialiasing for smooth text (disable for sharp pixels)"
         self._is_on = True  # Default to antialiasing enabled
 
         # Device info for grouping in device registry
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, address)},
-            name=name,
-            manufacturer="iPIXEL",
-            model="LED Matrix Display",
-            sw_version="1.0",
-        )
+        self._attr_device_info = build_device_info(address, name)
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -218,17 +204,10 @@ class iPIXELAutoUpdateSwitch(SwitchEntity, RestoreEntity):
         self._name = name
         self._attr_name = "Auto Update"
         self._attr_unique_id = f"{address}_auto_update"
-        self._attr_entity_description = "Automatically update display when text or settings change"
         self._is_on = False  # Default to manual updates only
 
         # Device info for grouping in device registry
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, address)},
-            name=name,
-            manufacturer="iPIXEL",
-            model="LED Matrix Display",
-            sw_version="1.0",
-        )
+        self._attr_device_info = build_device_info(address, name)
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -282,17 +261,10 @@ class iPIXELClock24HSwitch(SwitchEntity, RestoreEntity):
         self._name = name
         self._attr_name = "Clock 24h"
         self._attr_unique_id = f"{address}_clock_24h"
-        self._attr_entity_description = "Use 24-hour format for clock display"
         self._is_on = True  # Default to 24h format
 
         # Device info for grouping in device registry
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, address)},
-            name=name,
-            manufacturer="iPIXEL",
-            model="LED Matrix Display",
-            sw_version="1.0",
-        )
+        self._attr_device_info = build_device_info(address, name)
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -328,21 +300,19 @@ class iPIXELClock24HSwitch(SwitchEntity, RestoreEntity):
 
     async def _trigger_auto_update(self) -> None:
         """Trigger display update if auto-update is enabled and in clock mode."""
-        try:
-            # Check if we're in clock mode
-            mode_entity_id = get_entity_id_by_unique_id(self.hass, self._address, "mode_select", "select")
-            mode_state = self.hass.states.get(mode_entity_id) if mode_entity_id else None
-
-            if mode_state and mode_state.state == "clock":
-                # Check auto-update setting
-                auto_update_entity_id = get_entity_id_by_unique_id(self.hass, self._address, "auto_update", "switch")
-                auto_update_state = self.hass.states.get(auto_update_entity_id) if auto_update_entity_id else None
-
-                if auto_update_state and auto_update_state.state == "on":
-                    await update_ipixel_display(self.hass, self._name, self._api)
-                    _LOGGER.debug("Auto-update triggered due to clock 24h change")
-        except Exception as err:
-            _LOGGER.debug("Could not trigger auto-update: %s", err)
+        # Check if we're in clock mode
+        mode_entity_id = get_entity_id_by_unique_id(self.hass, self._address, "mode_select", "select")
+        mode_state = self.hass.states.get(mode_entity_id) if mode_entity_id else None
+        if mode_state is None or mode_state.state != "clock":
+            return
+
+        # Check auto-update setting
+        auto_update_entity_id = get_entity_id_by_unique_id(self.hass, self._address, "auto_update", "switch")
+        if not is_entity_on(self.hass, auto_update_entity_id):
+            return
+
+        await update_ipixel_display(self.hass, self._name, self._api)
+        _LOGGER.debug("Auto-update triggered due to clock 24h change")
 
 
 class iPIXELClockShowDateSwitch(SwitchEntity, RestoreEntity):
@@ -366,17 +336,10 @@ class iPIXELClockShowDateSwitch(SwitchEntity, RestoreEntity):
         self._name = name
         self._attr_name = "Clock Show Date"
         self._attr_unique_id = f"{address}_clock_show_date"
-        self._attr_entity_description = "Show date alongside time in clock display"
         self._is_on = True  # Default to showing date
 
         # Device info for grouping in device registry
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, address)},
-            name=name,
-            manufacturer="iPIXEL",
-            model="LED Matrix Display",
-            sw_version="1.0",
-        )
+        self._attr_device_info = build_device_info(address, name)
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -412,18 +375,16 @@ class iPIXELClockShowDateSwitch(SwitchEntity, RestoreEntity):
 
     async def _trigger_auto_update(self) -> None:
         """Trigger display update if auto-update is enabled and in clock mode."""
-        try:
-            # Check if we're in clock mode
-            mode_entity_id = get_entity_id_by_unique_id(self.hass, self._address, "mode_select", "select")
-            mode_state = self.hass.states.get(mode_entity_id) if mode_entity_id else None
-
-            if mode_state and mode_state.state == "clock":
-                # Check auto-update setting
-                auto_update_entity_id = get_entity_id_by_unique_id(self.hass, self._address, "auto_update", "switch")
-                auto_update_state = self.hass.states.get(auto_update_entity_id) if auto_update_entity_id else None
-
-                if auto_update_state and auto_update_state.state == "on":
-                    await update_ipixel_display(self.hass, self._name, self._api)
-                    _LOGGER.debug("Auto-update triggered due to clock show date change")
-        except Exception as err:
-            _LOGGER.debug("Could not trigger auto-update: %s", err)
\ No newline at end of file
+        # Check if we're in clock mode
+        mode_entity_id = get_entity_id_by_unique_id(self.hass, self._address, "mode_select", "select")
+        mode_state = self.hass.states.get(mode_entity_id) if mode_entity_id else None
+        if mode_state is None or mode_state.state != "clock":
+            return
+
+        # Check auto-update setting
+        auto_update_entity_id = get_entity_id_by_unique_id(self.hass, self._address, "auto_update", "switch")
+        if not is_entity_on(self.hass, auto_update_entity_id):
+            return
+
+        await update_ipixel_display(self.hass, self._name, self._api)
+        _LOGGER.debug("Auto-update triggered due to clock show date change")
\ No newline at end of file
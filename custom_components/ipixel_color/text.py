@@ -8,13 +8,12 @@ from homeassistant.components.text import TextEntity, TextMode
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.restore_state import RestoreEntity
 
 from .api import iPIXELAPI, iPIXELConnectionError
 from .const import DOMAIN, CONF_ADDRESS, CONF_NAME
-from .common import get_entity_id_by_unique_id
-from .common import resolve_template_variables, update_ipixel_display
+from .common import build_device_info, get_entity_id_by_unique_id, is_entity_on
+from .common import process_escape_sequences, resolve_template_variables, update_ipixel_display
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -67,13 +66,7 @@ class iPIXELTextDisplay(TextEntity, RestoreEntity):
         self._color_bg = (0, 0, 0)  # Black background
 
         # Device info for grouping in device registry
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, address)},
-            name=name,
-            manufacturer="iPIXEL",
-            model="LED Matrix Display",
-            sw_version="1.0",
-        )
+        self._attr_device_info = build_device_info(address, name)
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -111,7 +104,7 @@ class iPIXELTextDisplay(TextEntity, RestoreEntity):
             
             # Resolve templates and process escape sequences when sending to display
             template_resolved = await resolve_template_variables(self.hass, value)
-            processed_text = template_resolved.replace('\\n', '\n').replace('\\t', '\t')
+            processed_text = process_escape_sequences(template_resolved)
             
             # Auto-update is enabled, proceed with display update
             await self._update_display(processed_text)
@@ -133,15 +126,9 @@ class iPIXELTextDisplay(TextEntity, RestoreEntity):
 
     async def _get_auto_update_setting(self) -> bool:
         """Get the current auto-update setting from the switch entity."""
-        try:
-            # Get the auto-update switch entity
-            entity_id = get_entity_id_by_unique_id(self.hass, self._address, "auto_update", "switch")
-            state = self.hass.states.get(entity_id)
-            if state:
-                return state.state == "on"
-        except Exception as err:
-            _LOGGER.debug("Could not get auto-update setting: %s", err)
-        return False  # Default to manual updates only
+        # A missing switch means manual updates only
+        entity_id = get_entity_id_by_unique_id(self.hass, self._address, "auto_update", "switch")
+        return is_entity_on(self.hass, entity_id)
 
     async def async_update(self) -> None:
         """Update the entity state."""